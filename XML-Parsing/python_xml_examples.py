@@ -2,13 +2,63 @@
 #                        Python XML Parsing Examples
 # ============================================================================
 
-import xml.etree.ElementTree as ET
+import sys
+try:
+    # lxml binds libxml2 and is much faster on large documents
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+    # Make sure ElementTree is backed by the C accelerator, not pure Python
+    if '_elementtree' not in sys.modules:
+        raise ImportError("xml.etree.ElementTree is running without its C "
+                          "accelerator (_elementtree); refusing the slow "
+                          "pure-Python parser")
 import xml.sax
 import xml.sax.handler
-import xml.dom.minidom
-from io import StringIO
+from xml.parsers import expat
+from io import BytesIO, StringIO
 import json
-from collections import defaultdict
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import Counter
+from array import array
+
+if HAVE_LXML:
+    # Skip the xml:id hash table (none of the examples look elements up by
+    # ID) and drop whitespace-only text nodes between elements. Passed
+    # explicitly by _fromstring so lxml's global default parser is untouched
+    _PARSER = ET.XMLParser(collect_ids=False, remove_blank_text=True)
+    
+    # Compile the XPath expressions once instead of on every call
+    _X_BOOKS = ET.XPath('./book')
+    # xpath_like_queries: count() lets libxml2 return a number rather than
+    # building a node list only to take its length
+    _QX_PROG = ET.XPath('count(./book[@category=$c])')
+    _QX_RECENT = ET.XPath('count(./book[number(published)>$year])')
+    _QX_EXPENSIVE = ET.XPath('./book[number(price)>$price]/title/text()',
+                             smart_strings=False)
+
+
+def _fromstring(text):
+    """Parse an XML string with whichever ElementTree implementation is loaded"""
+    if HAVE_LXML:
+        # lxml rejects str input that carries an encoding declaration
+        if isinstance(text, str):
+            text = text.encode('utf-8')
+        return ET.fromstring(text, parser=_PARSER)
+    # Explicit C XMLParser + TreeBuilder pair
+    return ET.fromstring(text, parser=ET.XMLParser(target=ET.TreeBuilder()))
+
+
+def _books(root):
+    """Return the <book> children of root"""
+    if HAVE_LXML:
+        return _X_BOOKS(root)
+    return root.findall('book')
 
 # ============================================================================
 # Sample XML Data
@@ -38,6 +88,9 @@ BOOKS_XML = """<?xml version="1.0" encoding="UTF-8"?>
     </book>
 </library>"""
 
+# Parsed once and shared; examples that modify the tree work on a deep copy
+_BOOKS_ROOT = _fromstring(BOOKS_XML)
+
 # ============================================================================
 # ElementTree Examples (Python's Most Common XML Parser)
 # ============================================================================
@@ -53,27 +106,27 @@ class ElementTreeExamples:
         print("ElementTree Basic Parsing:")
         print("-" * 40)
         
-        try:
-            # Parse XML string
-            root = ET.fromstring(BOOKS_XML)
-            
-            # Get root element info
-            print(f"Library: {root.get('name')}")
-            print(f"Total books: {len(root.findall('book'))}")
+        # BOOKS_XML is parsed once at import time (_BOOKS_ROOT, see
+        # _fromstring), so a ParseError would surface there, not here
+        root = _BOOKS_ROOT
+        books = _books(root)
+        
+        # Get root element info
+        print(f"Library: {root.get('name')}")
+        print(f"Total books: {len(books)}")
+        
+        # Iterate through books
+        for book in books:
+            book_id = book.get('id')
+            category = book.get('category')
+            # One pass over the children instead of a find() per field
+            fields = {child.tag: child for child in book}
+            title = fields['title'].text
+            author = fields['author'].text
+            price = fields['price'].text
+            currency = fields['price'].get('currency')
             
-            # Iterate through books
-            for book in root.findall('book'):
-                book_id = book.get('id')
-                category = book.get('category')
-                title = book.find('title').text
-                author = book.find('author').text
-                price = book.find('price').text
-                currency = book.find('price').get('currency')
-                
-                print(f"Book {book_id} [{category}]: {title} by {author} - {price} {currency}")
-                
-        except ET.ParseError as e:
-            print(f"ElementTree parsing error: {e}")
+            print(f"Book {book_id} [{category}]: {title} by {author} - {price} {currency}")
     
     @staticmethod
     def advanced_operations():
@@ -82,7 +135,7 @@ class ElementTreeExamples:
         print("-" * 40)
         
         try:
-            root = ET.fromstring(BOOKS_XML)
+            root = copy.deepcopy(_BOOKS_ROOT)
             
             # Add new book
             new_book = ET.SubElement(root, 'book', id='4', category='ai')
@@ -105,7 +158,7 @@ class ElementTreeExamples:
             # Convert to string and display
             xml_str = ET.tostring(root, encoding='unicode')
             print("Modified XML structure created successfully")
-            print(f"Total books after modification: {len(root.findall('book'))}")
+            print(f"Total books after modification: {len(_books(root))}")
             
         except Exception as e:
             print(f"ElementTree modification error: {e}")
@@ -117,24 +170,35 @@ class ElementTreeExamples:
         print("-" * 40)
         
         try:
-            root = ET.fromstring(BOOKS_XML)
-            
-            # Find books by category
-            programming_books = [book for book in root.findall('book') 
-                               if book.get('category') == 'programming']
-            print(f"Programming books: {len(programming_books)}")
+            root = _BOOKS_ROOT
             
-            # Find books published after 2010
-            recent_books = [book for book in root.findall('book')
-                          if int(book.find('published').text) > 2010]
-            print(f"Books published after 2010: {len(recent_books)}")
+            if HAVE_LXML:
+                # Real XPath - predicates are evaluated inside libxml2
+                programming_count = int(_QX_PROG(root, c='programming'))
+                recent_count = int(_QX_RECENT(root, year=2010))
+                expensive_books = _QX_EXPENSIVE(root, price=30)
+            else:
+                # Evaluate all three queries in a single walk over the books
+                programming_count = 0
+                recent_count = 0
+                expensive_books = []
+                for book in _books(root):
+                    fields = {child.tag: child for child in book}
+                    
+                    # Count books by category
+                    if book.get('category') == 'programming':
+                        programming_count += 1
+                    
+                    # Count books published after 2010
+                    if int(fields['published'].text) > 2010:
+                        recent_count += 1
+                    
+                    # Find expensive books (price > 30)
+                    if float(fields['price'].text) > 30:
+                        expensive_books.append(fields['title'].text)
             
-            # Find expensive books (price > 30)
-            expensive_books = []
-            for book in root.findall('book'):
-                price = float(book.find('price').text)
-                if price > 30:
-                    expensive_books.append(book.find('title').text)
+            print(f"Programming books: {programming_count}")
+            print(f"Books published after 2010: {recent_count}")
             print(f"Expensive books (>$30): {expensive_books}")
             
         except Exception as e:
@@ -143,40 +207,130 @@ class ElementTreeExamples:
 # ============================================================================
 # SAX Parser Examples (Python)
 # ============================================================================
+# Only these tags carry text the handlers use; everything else is skipped
+BOOK_TEXT_TAGS = frozenset(('title', 'author', 'price', 'published', 'description'))
+STATS_TEXT_TAGS = frozenset(('author', 'price', 'published'))
+
+
+def _intern(value):
+    """Intern an attribute value drawn from a small vocabulary"""
+    return sys.intern(value) if value is not None else None
+
+
+def _float_column(values):
+    """Convert numeric strings to an array('d') column; None -> NaN"""
+    return array('d', [float(v) if v is not None else float('nan')
+                       for v in values])
+
+
+def _int_column(values):
+    """Convert numeric strings to an array('i') column; None -> 0"""
+    # 0 is only a placeholder - pair the column with _present_mask(values)
+    return array('i', [int(v) if v is not None else 0 for v in values])
+
+
+def _present_mask(values):
+    """Return an array('b') column that is 1 where values has an entry"""
+    return array('b', [v is not None for v in values])
+
 class BookSAXHandler(xml.sax.ContentHandler):
-    """Custom SAX handler for parsing books"""
+    """Custom SAX handler for parsing books into per-field columns"""
     
     def __init__(self):
-        self.books = []
+        # One column per field instead of one dict per book, so aggregates
+        # such as sum(self.prices) walk a single contiguous array
+        self.ids = []
+        self.categories = []
+        self.titles = []
+        self.authors = []
+        self.prices = array('d')
+        self.currencies = []
+        self.years = array('i')
+        self.descriptions = []
+        # Which books actually had a <price> / <published>; prices holds NaN
+        # and years a 0 placeholder for the rest. All four are array.array,
+        # so select present values with e.g.
+        # itertools.compress(self.years, self.has_year)
+        self.has_price = array('b')
+        self.has_year = array('b')
+        # Raw numeric text (None when missing), converted by endDocument
+        self._price_strs = []
+        self._year_strs = []
+        # One shared copy of each repeated text value, such as authors
+        self._str_pool = {}
+        # Scratch fields of the book being parsed, reused for every book
         self.current_book = {}
         self.current_tag = ""
-        self.current_content = ""
+        self.current_content = []
+        # Capture flags of the enclosing elements, restored on each end tag
+        self._capture = False
+        self._capture_stack = []
+    
+    # Per-book fields that to_dicts() leaves out when the book lacks them
+    _OPTIONAL_FIELDS = ('title', 'author', 'currency', 'price', 'published',
+                        'description')
+    
+    def to_dicts(self):
+        """Build the parsed books as a list of dicts, one per book"""
+        # The columns stay the primary storage; this is a one-off export
+        prices = [price if present else None
+                  for price, present in zip(self.prices, self.has_price)]
+        rows = zip(self.titles, self.authors, self.currencies, prices,
+                   self._year_strs, self.descriptions)
+        books = []
+        for book_id, category, row in zip(self.ids, self.categories, rows):
+            book = {'id': book_id, 'category': category}
+            # Leave out fields the document did not have
+            for key, value in zip(self._OPTIONAL_FIELDS, row):
+                if value is not None:
+                    book[key] = value
+            books.append(book)
+        return books
         
     def startElement(self, name, attrs):
         self.current_tag = name
-        self.current_content = ""
+        self.current_content = []
+        self._capture_stack.append(self._capture)
+        self._capture = name in BOOK_TEXT_TAGS
         
         if name == "book":
-            self.current_book = {
-                'id': attrs.get('id'),
-                'category': attrs.get('category')
-            }
+            self.current_book.clear()
+            self.ids.append(attrs.get('id'))
+            # Categories and currencies repeat across nearly every book
+            self.categories.append(_intern(attrs.get('category')))
         elif name == "price":
-            self.current_book['currency'] = attrs.get('currency')
+            self.current_book['currency'] = _intern(attrs.get('currency'))
             
     def characters(self, content):
-        self.current_content += content.strip()
+        if not self._capture:
+            return
+        # SAX may deliver text in many small chunks; join them once at the end
+        self.current_content.append(content)
         
     def endElement(self, name):
+        text = "".join(self.current_content).strip()
+        # A nested child must not switch off capture for its parent's text
+        self._capture = self._capture_stack.pop()
         if name == "book":
-            self.books.append(self.current_book.copy())
-            self.current_book = {}
-        elif name in ["title", "author", "published", "description"]:
-            self.current_book[name] = self.current_content
-        elif name == "price":
-            self.current_book['price'] = float(self.current_content)
+            # Flush the finished book into the columns
+            book = self.current_book
+            self.titles.append(book.get('title'))
+            author = book.get('author')
+            self.authors.append(self._str_pool.setdefault(author, author))
+            self._price_strs.append(book.get('price'))
+            self.currencies.append(book.get('currency'))
+            self._year_strs.append(book.get('published'))
+            self.descriptions.append(book.get('description'))
+        elif name in BOOK_TEXT_TAGS:
+            self.current_book[name] = text
             
-        self.current_content = ""
+        self.current_content = []
+    
+    def endDocument(self):
+        self.prices = _float_column(self._price_strs)
+        self.years = _int_column(self._year_strs)
+        self.has_price = _present_mask(self._price_strs)
+        self.has_year = _present_mask(self._year_strs)
 
 class StatisticsSAXHandler(xml.sax.ContentHandler):
     """SAX handler for collecting statistics"""
@@ -184,37 +338,110 @@ class StatisticsSAXHandler(xml.sax.ContentHandler):
     def __init__(self):
         self.stats = {
             'total_books': 0,
-            'categories': defaultdict(int),
+            'categories': {},
             'total_value': 0.0,
             'newest_year': 0,
             'authors': set()
         }
         self.current_tag = ""
-        self.current_content = ""
+        self.current_content = []
         self.current_category = ""
+        # Capture flags of the enclosing elements, restored on each end tag
+        self._capture = False
+        self._capture_stack = []
+        # Category of every book and raw numeric text, reduced in bulk by
+        # endDocument
+        self._cat_list = []
+        self._price_strs = []
+        self._year_strs = []
         
     def startElement(self, name, attrs):
         self.current_tag = name
-        self.current_content = ""
+        self.current_content = []
+        self._capture_stack.append(self._capture)
+        self._capture = name in STATS_TEXT_TAGS
         
         if name == "book":
-            self.stats['total_books'] += 1
             self.current_category = attrs.get('category', 'unknown')
-            self.stats['categories'][self.current_category] += 1
+            self._cat_list.append(self.current_category)
             
     def characters(self, content):
-        self.current_content += content.strip()
+        if not self._capture:
+            return
+        self.current_content.append(content)
         
     def endElement(self, name):
+        text = "".join(self.current_content).strip()
+        # A nested child must not switch off capture for its parent's text
+        self._capture = self._capture_stack.pop()
         if name == "price":
-            self.stats['total_value'] += float(self.current_content)
+            self._price_strs.append(text)
         elif name == "published":
-            year = int(self.current_content)
-            self.stats['newest_year'] = max(self.stats['newest_year'], year)
+            self._year_strs.append(text)
         elif name == "author":
-            self.stats['authors'].add(self.current_content)
+            self.stats['authors'].add(text)
             
-        self.current_content = ""
+        self.current_content = []
+    
+    def endDocument(self):
+        self.stats['total_books'] = len(self._cat_list)
+        self.stats['categories'] = dict(Counter(self._cat_list))
+        
+        prices = _float_column(self._price_strs)
+        years = _int_column(self._year_strs)
+        self.stats['total_value'] = sum(prices)
+        self.stats['newest_year'] = max(years, default=0)
+
+
+def expat_parse(data, handler):
+    """Feed data to a SAX ContentHandler straight from expat"""
+    # Bypass the xml.sax adapter layer and bind the handler's methods
+    # directly as expat callbacks
+    parser = expat.ParserCreate()
+    # Coalesce adjacent character data into a single characters() call
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.startElement
+    parser.EndElementHandler = handler.endElement
+    parser.CharacterDataHandler = handler.characters
+    
+    handler.startDocument()
+    parser.Parse(data, True)
+    handler.endDocument()
+    return handler
+
+
+def stream_parse(source, handler, chunk_size=64 * 1024):
+    """SAX-parse a file path or file object in fixed-size chunks"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return stream_parse(f, handler, chunk_size)
+    
+    # Feed the incremental parser chunk by chunk so peak memory does not
+    # grow with the size of the input
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    while True:
+        # Text-mode files return '' at EOF and binary ones b''
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        parser.feed(chunk)
+    parser.close()
+    return handler
+
+
+def parse_books(xml_bytes):
+    """Parse one books document and return its books as a list of dicts"""
+    return expat_parse(xml_bytes, BookSAXHandler()).to_dicts()
+
+
+def parse_many(documents, executor_class=ProcessPoolExecutor):
+    """Parse several books documents in parallel, one book list per document"""
+    # The handler callbacks are Python code that holds the GIL, so only
+    # separate processes parse in parallel. ThreadPoolExecutor is useful
+    # just to overlap reading documents from slow I/O
+    with executor_class(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(parse_books, documents))
 
 class SAXExamples:
     """Python SAX parsing examples"""
@@ -226,15 +453,16 @@ class SAXExamples:
         print("-" * 30)
         
         try:
-            handler = BookSAXHandler()
-            xml.sax.parseString(BOOKS_XML, handler)
+            handler = expat_parse(BOOKS_XML.encode('utf-8'), BookSAXHandler())
             
             print("SAX Parsing Results:")
-            for book in handler.books:
-                print(f"Book {book['id']} [{book['category']}]: {book['title']} "
-                      f"by {book['author']} - ${book['price']} {book['currency']}")
+            for book_id, category, title, author, price, currency in zip(
+                    handler.ids, handler.categories, handler.titles,
+                    handler.authors, handler.prices, handler.currencies):
+                print(f"Book {book_id} [{category}]: {title} "
+                      f"by {author} - ${price} {currency}")
                 
-        except xml.sax.SAXException as e:
+        except expat.ExpatError as e:
             print(f"SAX parsing error: {e}")
     
     @staticmethod
@@ -245,7 +473,7 @@ class SAXExamples:
         
         try:
             handler = StatisticsSAXHandler()
-            xml.sax.parseString(BOOKS_XML, handler)
+            stream_parse(BytesIO(BOOKS_XML.encode('utf-8')), handler)
             
             stats = handler.stats
             print(f"Total books: {stats['total_books']}")
@@ -256,10 +484,51 @@ class SAXExamples:
             
         except xml.sax.SAXException as e:
             print(f"SAX statistics error: {e}")
+    
+    @staticmethod
+    def parallel_sax_parsing():
+        """Parse a batch of documents concurrently"""
+        print("\nParallel SAX Parsing:")
+        print("-" * 30)
+        
+        try:
+            documents = [build_large_xml(100).encode('utf-8') for _ in range(8)]
+            try:
+                results = parse_many(documents)
+            except (BrokenProcessPool, NotImplementedError, OSError) as e:
+                # No usable process pool here (e.g. no process semaphores);
+                # parse the batch serially so the remaining demos still run
+                print(f"Process pool unavailable ({e!r}), parsing serially")
+                results = [parse_books(document) for document in documents]
+            
+            total = sum(len(books) for books in results)
+            print(f"Parsed {len(results)} documents ({total} books)")
+            
+        except expat.ExpatError as e:
+            print(f"Parallel parsing error: {e}")
 
 # ============================================================================
 # Python-specific parsing utilities
 # ============================================================================
+def _test_book_xml(i):
+    """Return the XML for the i-th synthetic test book"""
+    return f"""
+            <book id="{i+4}" category="test">
+                <title>Test Book {i+1}</title>
+                <author>Test Author {i+1}</author>
+                <price currency="USD">{20 + (i % 50)}.99</price>
+                <published>{2000 + (i % 23)}</published>
+            </book>"""
+
+
+def build_large_xml(extra_books):
+    """Return BOOKS_XML with extra_books synthetic books appended"""
+    # Collect the pieces and join once; += on a str is quadratic
+    parts = [BOOKS_XML.replace('</library>', '')]
+    parts.extend(_test_book_xml(i) for i in range(extra_books))
+    parts.append('</library>')
+    return "".join(parts)
+
 class PythonXMLUtilities:
     """Useful Python XML parsing utilities"""
     
@@ -269,36 +538,78 @@ class PythonXMLUtilities:
         print("\nXML to Dictionary Conversion:")
         print("-" * 40)
         
-        def xml_to_dict_recursive(element):
-            """Recursively convert XML element to dict"""
+        def start_element(element):
+            """Return a leaf's text, or a dict holding attributes and text"""
+            text = element.text.strip() if element.text else ''
+            if text and len(element) == 0:  # No child elements
+                return text
+            
             result = {}
             
             # Add attributes
             if element.attrib:
-                result['@attributes'] = element.attrib
+                # lxml's attrib is a live proxy, not a plain dict
+                result['@attributes'] = dict(element.attrib)
             
             # Add text content
-            if element.text and element.text.strip():
-                if len(element) == 0:  # No child elements
-                    return element.text.strip()
-                result['text'] = element.text.strip()
+            if text:
+                result['text'] = text
             
-            # Add child elements
-            for child in element:
-                child_data = xml_to_dict_recursive(child)
-                if child.tag in result:
-                    # Multiple elements with same tag - convert to list
-                    if not isinstance(result[child.tag], list):
-                        result[child.tag] = [result[child.tag]]
-                    result[child.tag].append(child_data)
+            return result
+        
+        def add_child(result, tag, child_data):
+            """Store child_data under tag in result"""
+            if tag in result:
+                # Multiple elements with same tag - convert to list
+                if not isinstance(result[tag], list):
+                    result[tag] = [result[tag]]
+                result[tag].append(child_data)
+            else:
+                result[tag] = child_data
+        
+        def xml_to_dict_iterative(root):
+            """Convert XML element to dict with an explicit stack, no recursion"""
+            root_result = start_element(root)
+            if len(root) == 0:
+                return root_result
+            
+            # Each frame is (element, iterator over its children, its dict)
+            stack = [(root, iter(root), root_result)]
+            while stack:
+                element, children, result = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    # All children done - merge this element into its parent
+                    stack.pop()
+                    if stack:
+                        add_child(stack[-1][2], element.tag, result)
+                elif len(child):
+                    stack.append((child, iter(child), start_element(child)))
                 else:
-                    result[child.tag] = child_data
+                    add_child(result, child.tag, start_element(child))
             
-            return result
+            return root_result
+        
+        def xml_to_dict_iterwalk(root):
+            """Convert XML element to dict from lxml's iterwalk events"""
+            # iterwalk emits start/end events over the parsed tree from C;
+            # the stack holds the value of every open element
+            stack = []
+            for event, element in ET.iterwalk(root, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(start_element(element))
+                    continue
+                result = stack.pop()
+                if not stack:
+                    return result
+                add_child(stack[-1], element.tag, result)
         
         try:
-            root = ET.fromstring(BOOKS_XML)
-            xml_dict = {root.tag: xml_to_dict_recursive(root)}
+            root = _BOOKS_ROOT
+            if HAVE_LXML:
+                xml_dict = {root.tag: xml_to_dict_iterwalk(root)}
+            else:
+                xml_dict = {root.tag: xml_to_dict_iterative(root)}
             
             # Pretty print the dictionary
             print(json.dumps(xml_dict, indent=2))
@@ -315,37 +626,58 @@ class PythonXMLUtilities:
         import time
         
         # Simulate larger XML by repeating books
-        large_xml = BOOKS_XML.replace('</library>', '')
-        for i in range(100):  # Add 100 more books
-            book_xml = f"""
-            <book id="{i+4}" category="test">
-                <title>Test Book {i+1}</title>
-                <author>Test Author {i+1}</author>
-                <price currency="USD">{20 + (i % 50)}.99</price>
-                <published>{2000 + (i % 23)}</published>
-            </book>"""
-            large_xml += book_xml
-        large_xml += '</library>'
+        large_xml = build_large_xml(100)  # Add 100 more books
         
-        # ElementTree timing
+        # ElementTree timing - stream with iterparse instead of building
+        # the whole tree and walking it again with findall
         start_time = time.time()
-        root = ET.fromstring(large_xml)
-        books = root.findall('book')
+        book_count = 0
+        root = None
+        buf = BytesIO(large_xml.encode('utf-8'))
+        for event, elem in ET.iterparse(buf, events=('start', 'end')):
+            if root is None:
+                # The first start event is the document root
+                root = elem
+            if event == 'end' and elem.tag == 'book':
+                book_count += 1
+                elem.clear()
+                # Drop finished books so memory stays flat on both backends
+                if HAVE_LXML:
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                else:
+                    root.clear()
         et_time = time.time() - start_time
         
         # SAX timing
         start_time = time.time()
         handler = BookSAXHandler()
-        xml.sax.parseString(large_xml, handler)
+        stream_parse(BytesIO(large_xml.encode('utf-8')), handler)
         sax_time = time.time() - start_time
         
-        print(f"ElementTree: {et_time:.4f}s ({len(books)} books)")
-        print(f"SAX: {sax_time:.4f}s ({len(handler.books)} books)")
+        print(f"ElementTree: {et_time:.4f}s ({book_count} books)")
+        print(f"SAX: {sax_time:.4f}s ({len(handler.ids)} books)")
         print(f"SAX is {et_time/sax_time:.1f}x faster for this data size")
 
 # ============================================================================
 # Error Handling Examples
 # ============================================================================
+# Kept as UTF-8 bytes so the parsers read them without re-encoding
+MALFORMED_XML = b"""<?xml version="1.0"?>
+        <library>
+            <book id="1">
+                <title>Unclosed Title
+                <author>Missing End Tag</author>
+            </book>
+        </library>"""
+
+# Encoded once here - a bytes literal cannot hold the non-ASCII text
+SPECIAL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+        <book>
+            <title>Pythön & XML Parsing</title>
+            <description>Special chars: áéíóú, ñ, ü, ß</description>
+        </book>""".encode('utf-8')
+
 class ErrorHandlingExamples:
     """XML parsing error handling examples"""
     
@@ -355,24 +687,16 @@ class ErrorHandlingExamples:
         print("\nError Handling Examples:")
         print("-" * 30)
         
-        malformed_xml = """<?xml version="1.0"?>
-        <library>
-            <book id="1">
-                <title>Unclosed Title
-                <author>Missing End Tag</author>
-            </book>
-        </library>"""
-        
         # ElementTree error handling
         try:
-            ET.fromstring(malformed_xml)
+            _fromstring(MALFORMED_XML)
         except ET.ParseError as e:
             print(f"ElementTree ParseError: {e}")
         
         # SAX error handling
         try:
             handler = BookSAXHandler()
-            xml.sax.parseString(malformed_xml, handler)
+            stream_parse(BytesIO(MALFORMED_XML), handler)
         except xml.sax.SAXException as e:
             print(f"SAX ParseError: {e}")
     
@@ -383,14 +707,8 @@ class ErrorHandlingExamples:
         print("-" * 20)
         
         # XML with special characters
-        special_xml = """<?xml version="1.0" encoding="UTF-8"?>
-        <book>
-            <title>Pythön & XML Parsing</title>
-            <description>Special chars: áéíóú, ñ, ü, ß</description>
-        </book>"""
-        
         try:
-            root = ET.fromstring(special_xml.encode('utf-8'))
+            root = _fromstring(SPECIAL_XML)
             title = root.find('title').text
             desc = root.find('description').text
             print(f"Title: {title}")
@@ -414,6 +732,7 @@ def main():
     # SAX examples
     SAXExamples.basic_sax_parsing()
     SAXExamples.statistics_sax_parsing()
+    SAXExamples.parallel_sax_parsing()
     
     # Python utilities
     PythonXMLUtilities.xml_to_dict()